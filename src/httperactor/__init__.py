@@ -4,16 +4,32 @@ from .abc.error_handler import ErrorHandler
 from .abc.request import Request
 from .client import HttpClient
 from .error_handler import StderrErrorHandler
+from .executor import ShardedExecutor
 from .http_method import HttpMethod
 from .interactor import HttpInteractor
+from .pool import HttpClientPool, PoolStats
+from .rate_limiter import RateLimiter, RateLimiterStats
+from .retry import RetryBudget, RetryPolicy
+from .traffic import RecordingTransport, ReplayTransport
+from .write_behind import WriteBehindQueue
 
 __all__ = [
     "AuthMiddleware",
     "ErrorHandler",
     "HttpClientBase",
     "HttpClient",
+    "HttpClientPool",
     "HttpInteractor",
     "HttpMethod",
+    "PoolStats",
+    "RateLimiter",
+    "RateLimiterStats",
+    "RecordingTransport",
+    "ReplayTransport",
     "Request",
+    "RetryBudget",
+    "RetryPolicy",
+    "ShardedExecutor",
     "StderrErrorHandler",
+    "WriteBehindQueue",
 ]
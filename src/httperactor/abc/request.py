@@ -46,6 +46,24 @@ class Request(Generic[TResponse], ABC):
         """
         return HttpMethod.GET
 
+    @property
+    def idempotent(self) -> bool:
+        """Whether the request can be safely retried.
+
+        Defaults to `True` for `GET`, `PUT` and `DELETE` requests.
+        """
+        return self.method in (HttpMethod.GET, HttpMethod.PUT, HttpMethod.DELETE)
+
+    @property
+    def rate_limit_class(self) -> type[Request]:
+        """The class used to look up the rate limiter of the request.
+
+        Limiters registered for this class or any of its base classes apply.
+        Requests sent on behalf of another request return the class of the
+        original one. Defaults to the class of the request.
+        """
+        return type(self)
+
     @abstractmethod
     def map_response(self, response: str) -> TResponse:
         """Map raw response text to an object.
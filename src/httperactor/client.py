@@ -1,9 +1,13 @@
+import asyncio
+from collections.abc import Mapping
 from typing import TypeVar
 
 import httpx
 
 from .abc import AuthMiddleware, HttpClientBase, Request
 from .error_handler import ErrorHandler, StderrErrorHandler
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
 
 __all__ = ["HttpClient"]
 
@@ -15,10 +19,14 @@ TResponse = TypeVar("TResponse")
 class HttpClient(HttpClientBase[httpx.Request]):
     """An HTTP client wrapping an `httpx.AsyncClient`."""
 
-    __slots__ = ("_client", "_error_handler")
+    __slots__ = ("_client", "_error_handler", "_rate_limiters", "_retry_policy")
 
     def __init__(
-        self, httpx_client: httpx.AsyncClient, error_handler: ErrorHandler | None = None
+        self,
+        httpx_client: httpx.AsyncClient,
+        error_handler: ErrorHandler | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiters: Mapping[str | type[Request], RateLimiter] | None = None,
     ):
         """Initialize new instance with a httpx client and an optional error handler.
 
@@ -26,9 +34,17 @@ class HttpClient(HttpClientBase[httpx.Request]):
             httpx_client (httpx.AsyncClient): The `httpx` async client.
             error_handler (ErrorHandler | None): An optional error handler.
                 Defaults to `StderrErrorHandler`.
+            retry_policy (RetryPolicy | None): An optional policy for retrying failed
+                requests. Defaults to `None`, which sends every request once.
+            rate_limiters (Mapping[str | type[Request], RateLimiter] | None): Optional
+                rate limiters keyed by `Request` subclass or by host. Defaults to `None`.
         """
         self._client: httpx.AsyncClient = httpx_client
         self._error_handler: ErrorHandler = error_handler or StderrErrorHandler()
+        self._retry_policy: RetryPolicy | None = retry_policy
+        self._rate_limiters: Mapping[str | type[Request], RateLimiter] = (
+            rate_limiters or {}
+        )
 
     async def send(
         self,
@@ -40,6 +56,10 @@ class HttpClient(HttpClientBase[httpx.Request]):
         Creates an `httpx.Request` based on the `request`, and if provided,
         authenticates it using the auth strategy.
 
+        If a rate limiter matches the request's `rate_limit_class` or host, the
+        request waits for it before every attempt. If a retry policy is provided,
+        failed attempts are retried as long as the policy allows it.
+
         Returns the result of mapping the response text using the `request.map_response`.
         If an exception is thrown at any stage, it's caught and handled
         by the error handler.
@@ -53,17 +73,72 @@ class HttpClient(HttpClientBase[httpx.Request]):
             The parsed response if the request is successful; `None` otherwise.
         """
         try:
-            httpx_req = self._client.build_request(
-                method=request.method,
-                url=request.path,
-                headers=request.headers,
-                json=request.body,
-            )
+            attempt = 1
+            while True:
+                httpx_req = self._client.build_request(
+                    method=request.method,
+                    url=request.path,
+                    headers=request.headers,
+                    json=request.body,
+                )
+
+                res = await self._send_attempt(request, httpx_req, auth, attempt)
+                if res is not None:
+                    res.raise_for_status()
+                    return request.map_response(res.text)
+
+                attempt += 1
+        except Exception as error:
+            await self._error_handler.handle(error)
+            return None
 
+    async def _send_attempt(
+        self,
+        request: Request,
+        httpx_req: httpx.Request,
+        auth: AuthMiddleware[httpx.Request] | None,
+        attempt: int,
+    ) -> httpx.Response | None:
+        """Send a single attempt, returning `None` if it should be retried."""
+        limiter = self._rate_limiter(request, httpx_req)
+        if limiter is not None:
+            await limiter.acquire()
+
+        try:
             res = await self._client.send(httpx_req, auth=auth.apply if auth else None)
-            res.raise_for_status()
+        except httpx.TransportError:
+            delay = self._retry_delay(request, attempt)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            return None
 
-            return request.map_response(res.text)
-        except Exception as error:
-            await self._error_handler.handle(error)
+        if limiter is not None:
+            limiter.update(res.headers)
+
+        if res.is_success:
+            return res
+
+        delay = self._retry_delay(request, attempt, res)
+        if delay is None:
+            return res
+        await asyncio.sleep(delay)
+        return None
+
+    def _retry_delay(
+        self, request: Request, attempt: int, response: httpx.Response | None = None
+    ) -> float | None:
+        if self._retry_policy is None:
+            return None
+        return self._retry_policy.delay(request, attempt, response)
+
+    def _rate_limiter(
+        self, request: Request, httpx_req: httpx.Request
+    ) -> RateLimiter | None:
+        if not self._rate_limiters:
             return None
+
+        for cls in request.rate_limit_class.__mro__:
+            if cls in self._rate_limiters:
+                return self._rate_limiters[cls]
+        return self._rate_limiters.get(httpx_req.url.host)
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+
+from pydepot import Action, Store
+
+from .abc import HttpClientBase
+from .interactor import HttpInteractor
+
+__all__ = ["ShardedExecutor"]
+
+
+TState = TypeVar("TState")
+"""Invariant type variable for a generic state."""
+
+InteractorFactory = Callable[..., HttpInteractor]
+"""A picklable callable creating an interactor from an HTTP client, a store and args."""
+
+_Job = tuple[InteractorFactory, tuple[Any, ...]]
+
+_worker_client: HttpClientBase | None = None
+
+
+class _CollectingStore(Store[Any]):
+    """A worker-side store collecting dispatched actions instead of applying them.
+
+    Its state is a snapshot of the parent's state taken when the batch was sent,
+    and is not updated by the collected actions.
+    """
+
+    __slots__ = ("actions",)
+
+    def __init__(self, state: Any) -> None:
+        super().__init__(initial_state=state)
+        self.actions: list[Action] = []
+
+    def dispatch(self, action: Action) -> None:
+        self.actions.append(action)
+
+
+def _init_worker(client_factory: Callable[[], HttpClientBase]) -> None:
+    global _worker_client  # noqa: PLW0603
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    _worker_client = client_factory()
+
+
+async def _run_job(job: _Job, state: Any) -> list[Action]:
+    factory, args = job
+    store = _CollectingStore(state)
+    await factory(_worker_client, store, *args).execute()
+    return store.actions
+
+
+def _run_batch(jobs: Sequence[_Job], state: Any) -> list[list[Action] | BaseException]:
+    return asyncio.get_event_loop().run_until_complete(
+        asyncio.gather(*(_run_job(job, state) for job in jobs), return_exceptions=True)
+    )
+
+
+class _Shard:
+    """A single worker process together with the jobs waiting to be sent to it."""
+
+    __slots__ = ("busy", "futures", "jobs", "pool")
+
+    def __init__(self, pool: ProcessPoolExecutor):
+        self.pool: ProcessPoolExecutor = pool
+        self.jobs: list[_Job] = []
+        self.futures: list[asyncio.Future[None]] = []
+        self.busy: bool = False
+
+
+class ShardedExecutor(Generic[TState]):
+    """An executor running interactors across worker processes.
+
+    Every worker process has its own event loop and `HttpClientBase`. Actions
+    dispatched by the interactors are sent back in batches and dispatched to the
+    parent's store in the order the interactors were submitted to each worker.
+
+    If a worker process dies, the interactors of its current batch fail with
+    `BrokenProcessPool` and the worker is replaced by a new process.
+
+    Failures are reported through the futures returned by `submit`, which should
+    be awaited.
+    """
+
+    __slots__ = (
+        "_client_factory",
+        "_max_batch_size",
+        "_mp_context",
+        "_round_robin",
+        "_shards",
+        "_share_state",
+        "_store",
+        "_tasks",
+    )
+
+    def __init__(
+        self,
+        store: Store[TState],
+        client_factory: Callable[[], HttpClientBase],
+        workers: int | None = None,
+        max_batch_size: int = 100,
+        mp_context: BaseContext | None = None,
+        share_state: bool = False,
+    ):
+        """Initialize new executor with the store and a factory of HTTP clients.
+
+        Args:
+            store (Store[TState]): The store to dispatch actions to.
+            client_factory (Callable[[], HttpClientBase]): A picklable callable
+                creating the HTTP client of each worker.
+            workers (int | None): The number of worker processes.
+                Defaults to the number of CPUs.
+            max_batch_size (int): Maximum number of interactors sent to a worker
+                at once. Defaults to `100`.
+            mp_context (BaseContext | None): Optional multiprocessing context used
+                to start the workers. Defaults to `None`.
+            share_state (bool): Whether to send a snapshot of the store's state with
+                every batch, so interactors can read it in the worker; the state must
+                be picklable, and is pickled by the parent for every batch. If
+                `False`, the worker store's state is `None`. Defaults to `False`.
+        """
+        self._store: Store[TState] = store
+        self._client_factory: Callable[[], HttpClientBase] = client_factory
+        self._max_batch_size: int = max_batch_size
+        self._mp_context: BaseContext | None = mp_context
+        self._share_state: bool = share_state
+        self._shards: list[_Shard] = [
+            _Shard(self._create_pool()) for _ in range(workers or os.cpu_count() or 1)
+        ]
+        self._round_robin: itertools.cycle[_Shard] = itertools.cycle(self._shards)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> ShardedExecutor[TState]:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def submit(
+        self, factory: InteractorFactory, *args: Any, key: Hashable | None = None
+    ) -> asyncio.Future[None]:
+        """Schedule an interactor for execution in a worker process.
+
+        The interactor is created in the worker by calling
+        `factory(http_client, store, *args)`, so the `factory` and `args` must be
+        picklable; an `HttpInteractor` subclass is a valid factory.
+
+        With `share_state`, the worker's store holds a snapshot of the parent's
+        state taken when the batch is sent; actions dispatched in the worker are
+        not applied to it.
+
+        Args:
+            factory (InteractorFactory): The callable creating the interactor.
+            *args (Any): Additional arguments passed to the `factory`.
+            key (Hashable | None): Optional sharding key. Interactors with equal keys
+                run in the same worker. Defaults to `None`, which spreads the
+                interactors evenly.
+
+        Returns:
+            A future resolved once the interactor's actions are dispatched, or set
+            with the exception raised by the interactor or the store. Await it to
+            retrieve the exception, as it is not passed to any `ErrorHandler`.
+        """
+        shard = (
+            next(self._round_robin)
+            if key is None
+            else self._shards[hash(key) % len(self._shards)]
+        )
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        shard.jobs.append((factory, args))
+        shard.futures.append(future)
+
+        if not shard.busy:
+            self._schedule(shard)
+        return future
+
+    async def execute(
+        self, factory: InteractorFactory, *args: Any, key: Hashable | None = None
+    ) -> None:
+        """Execute an interactor in a worker process and wait for its actions.
+
+        Args:
+            factory (InteractorFactory): The callable creating the interactor.
+            *args (Any): Additional arguments passed to the `factory`.
+            key (Hashable | None): Optional sharding key. Defaults to `None`.
+        """
+        await self.submit(factory, *args, key=key)
+
+    async def aclose(self) -> None:
+        """Wait for the submitted interactors and shut down the worker processes."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+        await asyncio.gather(
+            *(asyncio.to_thread(shard.pool.shutdown) for shard in self._shards)
+        )
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._client_factory,),
+        )
+
+    def _schedule(self, shard: _Shard) -> None:
+        shard.busy = True
+        task = asyncio.create_task(self._run(shard))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, shard: _Shard) -> None:
+        await asyncio.sleep(0)
+
+        jobs = shard.jobs[: self._max_batch_size]
+        futures = shard.futures[: self._max_batch_size]
+        del shard.jobs[: self._max_batch_size]
+        del shard.futures[: self._max_batch_size]
+
+        try:
+            results = await self._send_batch(shard, jobs)
+            for future, result in zip(futures, results, strict=True):
+                if not future.done():
+                    self._resolve(future, result)
+        finally:
+            if shard.jobs:
+                self._schedule(shard)
+            else:
+                shard.busy = False
+
+    async def _send_batch(
+        self, shard: _Shard, jobs: list[_Job]
+    ) -> list[list[Action] | BaseException]:
+        state = self._store.state if self._share_state else None
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(shard.pool, _run_batch, jobs, state)
+        except BrokenProcessPool as error:
+            shard.pool.shutdown(wait=False)
+            shard.pool = self._create_pool()
+            return [error] * len(jobs)
+        except Exception as error:
+            return [error] * len(jobs)
+
+    def _resolve(
+        self, future: asyncio.Future[None], result: list[Action] | BaseException
+    ) -> None:
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+            return
+
+        try:
+            for action in result:
+                self._store.dispatch(action)
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
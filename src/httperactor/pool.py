@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Mapping
+from types import TracebackType
+from typing import NamedTuple, cast
+
+import httpx
+
+from .abc import ErrorHandler, Request
+from .client import HttpClient
+from .error_handler import StderrErrorHandler
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+
+__all__ = ["HttpClientPool", "PoolStats"]
+
+
+class PoolStats(NamedTuple):
+    """Utilization of the connection pool for a single base URL."""
+
+    base_url: str
+    max_connections: int
+    in_flight: int
+    """The number of requests currently being sent or waiting for a connection."""
+
+    peak_in_flight: int
+    """The highest number of requests sent at the same time."""
+
+    requests: int
+    """The number of requests sent, including warm-up and keep-alive probes."""
+
+    saturated_requests: int
+    """The number of requests that had to wait for a free connection.
+
+    Only tracked for HTTP/1.1 pools; always `0` with HTTP/2, where many requests
+    share a single connection.
+    """
+
+    @property
+    def utilization(self) -> float:
+        """Requests in flight per available connection.
+
+        For HTTP/1.1 pools, values above `1.0` mean requests are queued waiting for
+        a free connection. HTTP/2 pools multiplex requests over shared connections,
+        so higher values are expected there.
+        """
+        return self.in_flight / self.max_connections
+
+
+class _CountedStream(httpx.AsyncByteStream):
+    """A response stream that reports when it is closed."""
+
+    __slots__ = ("_closed", "_on_close", "_stream")
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream: httpx.AsyncByteStream = stream
+        self._on_close: Callable[[], None] = on_close
+        self._closed: bool = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+        await self._stream.aclose()
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """A transport that tracks how many requests are in flight.
+
+    A request is in flight until its response stream is closed.
+    """
+
+    __slots__ = (
+        "_saturation_threshold",
+        "_transport",
+        "in_flight",
+        "peak_in_flight",
+        "requests",
+        "saturated",
+    )
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, saturation_threshold: int | None
+    ):
+        self._transport: httpx.AsyncBaseTransport = transport
+        self._saturation_threshold: int | None = saturation_threshold
+        self.in_flight: int = 0
+        self.peak_in_flight: int = 0
+        self.requests: int = 0
+        self.saturated: int = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if (
+            self._saturation_threshold is not None
+            and self.in_flight >= self._saturation_threshold
+        ):
+            self.saturated += 1
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountedStream(
+                cast(httpx.AsyncByteStream, response.stream), self._release
+            ),
+            extensions=response.extensions,
+        )
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _PooledClient:
+    """A shared client for a base URL together with its keep-alive task."""
+
+    __slots__ = ("http_client", "httpx_client", "probe_task", "transport")
+
+    def __init__(
+        self,
+        httpx_client: httpx.AsyncClient,
+        transport: _CountingTransport,
+        http_client: HttpClient,
+    ):
+        self.httpx_client: httpx.AsyncClient = httpx_client
+        self.transport: _CountingTransport = transport
+        self.http_client: HttpClient = http_client
+        self.probe_task: asyncio.Task | None = None
+
+
+class HttpClientPool:
+    """A factory and lifecycle manager of shared, pre-warmed `HttpClient`s.
+
+    One `httpx.AsyncClient` with a tuned connection pool is created per base URL
+    and shared by every caller asking for that base URL.
+    """
+
+    __slots__ = (
+        "_clients",
+        "_error_handler",
+        "_http2",
+        "_limits",
+        "_probe_interval",
+        "_probe_path",
+        "_rate_limiters",
+        "_retry_policy",
+        "_timeout",
+        "_warmup_connections",
+    )
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+        timeout: float = 5.0,
+        warmup_connections: int = 0,
+        probe_path: str = "/",
+        probe_interval: float | None = None,
+        error_handler: ErrorHandler | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiters: Mapping[str | type[Request], RateLimiter] | None = None,
+    ):
+        """Initialize new pool with connection limits and warm-up settings.
+
+        Args:
+            max_connections (int): Maximum number of connections per base URL.
+                Defaults to `100`.
+            max_keepalive_connections (int): Maximum number of idle connections kept
+                open per base URL. Defaults to `20`.
+            keepalive_expiry (float): Seconds an idle connection is kept open.
+                Defaults to `5.0`.
+            http2 (bool): Whether to enable HTTP/2, which requires the `h2` package.
+                Defaults to `False`.
+            timeout (float): Timeout in seconds for every request. Defaults to `5.0`.
+            warmup_connections (int): Number of connections opened when a client is
+                created, capped at `max_keepalive_connections`. Defaults to `0`.
+            probe_path (str): Path of the `HEAD` requests used to open and keep
+                connections alive. Defaults to `"/"`.
+            probe_interval (float | None): Seconds between keep-alive probes, which
+                reopen `warmup_connections` connections of idle pools, or `None`
+                to disable them. Must be shorter than `keepalive_expiry`, or the
+                connections expire before they are probed. Defaults to `None`.
+            error_handler (ErrorHandler | None): An optional error handler for the
+                clients and failed probes. Defaults to `StderrErrorHandler`.
+            retry_policy (RetryPolicy | None): An optional retry policy shared by the
+                clients. Defaults to `None`.
+            rate_limiters (Mapping[str | type[Request], RateLimiter] | None): Optional
+                rate limiters shared by the clients, keyed by `Request` subclass or by
+                host. Defaults to `None`.
+
+        Raises:
+            ValueError: If `probe_interval` is not shorter than `keepalive_expiry`.
+        """
+        if probe_interval is not None and probe_interval >= keepalive_expiry:
+            raise ValueError(probe_interval)
+
+        self._limits: httpx.Limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2: bool = http2
+        self._timeout: float = timeout
+        self._warmup_connections: int = min(warmup_connections, max_keepalive_connections)
+        self._probe_path: str = probe_path
+        self._probe_interval: float | None = probe_interval
+        self._error_handler: ErrorHandler = error_handler or StderrErrorHandler()
+        self._retry_policy: RetryPolicy | None = retry_policy
+        self._rate_limiters: Mapping[
+            str | type[Request], RateLimiter
+        ] | None = rate_limiters
+        self._clients: dict[str, _PooledClient] = {}
+
+    async def __aenter__(self) -> HttpClientPool:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def client(self, base_url: str) -> HttpClient:
+        """Get the shared client for a base URL.
+
+        The client is created and warmed up on first use; callers asking for it
+        while it is warming up get it right away.
+
+        Args:
+            base_url (str): The base URL of the requests.
+
+        Returns:
+            The shared client.
+        """
+        pooled = self._clients.get(base_url)
+        if pooled is None:
+            pooled = self._create(base_url)
+            self._clients[base_url] = pooled
+            await self._warm_up(pooled)
+            if self._probe_interval is not None:
+                pooled.probe_task = asyncio.create_task(
+                    self._keep_alive(pooled, self._probe_interval)
+                )
+
+        return pooled.http_client
+
+    async def start(self, *base_urls: str) -> None:
+        """Create and warm up clients for the base URLs ahead of the first request.
+
+        Args:
+            *base_urls (str): The base URLs to warm up.
+        """
+        await asyncio.gather(*(self.client(base_url) for base_url in base_urls))
+
+    def stats(self) -> list[PoolStats]:
+        """Report the utilization of every pool.
+
+        Returns:
+            The statistics of each base URL's pool.
+        """
+        return [
+            PoolStats(
+                base_url=base_url,
+                max_connections=self._limits.max_connections or 0,
+                in_flight=pooled.transport.in_flight,
+                peak_in_flight=pooled.transport.peak_in_flight,
+                requests=pooled.transport.requests,
+                saturated_requests=pooled.transport.saturated,
+            )
+            for base_url, pooled in self._clients.items()
+        ]
+
+    async def aclose(self) -> None:
+        """Stop the keep-alive probes and close every client."""
+        clients, self._clients = self._clients, {}
+        probe_tasks = [
+            pooled.probe_task
+            for pooled in clients.values()
+            if pooled.probe_task is not None
+        ]
+        for task in probe_tasks:
+            task.cancel()
+        await asyncio.gather(*probe_tasks, return_exceptions=True)
+        await asyncio.gather(
+            *(pooled.httpx_client.aclose() for pooled in clients.values())
+        )
+
+    def _create(self, base_url: str) -> _PooledClient:
+        transport = _CountingTransport(
+            httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2),
+            saturation_threshold=None if self._http2 else self._limits.max_connections,
+        )
+        httpx_client = httpx.AsyncClient(
+            base_url=base_url, transport=transport, timeout=self._timeout
+        )
+        return _PooledClient(
+            httpx_client=httpx_client,
+            transport=transport,
+            http_client=HttpClient(
+                httpx_client,
+                error_handler=self._error_handler,
+                retry_policy=self._retry_policy,
+                rate_limiters=self._rate_limiters,
+            ),
+        )
+
+    async def _warm_up(self, pooled: _PooledClient) -> None:
+        await asyncio.gather(
+            *(self._probe(pooled) for _ in range(self._warmup_connections))
+        )
+
+    async def _probe(self, pooled: _PooledClient) -> None:
+        try:
+            await pooled.httpx_client.head(self._probe_path)
+        except Exception as error:
+            await self._error_handler.handle(error)
+
+    async def _keep_alive(self, pooled: _PooledClient, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if pooled.transport.in_flight == 0:
+                await self._warm_up(pooled)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from .retry import retry_after
+
+__all__ = ["RateLimiter", "RateLimiterStats"]
+
+
+_EPOCH_THRESHOLD = 1_000_000_000
+"""`X-RateLimit-Reset` values above this are Unix timestamps rather than seconds."""
+
+
+class RateLimiterStats(NamedTuple):
+    """Time callers spent waiting for a `RateLimiter`."""
+
+    acquired: int
+    """The number of requests let through."""
+
+    delayed: int
+    """The number of requests that had to wait."""
+
+    total_wait: float
+    """Seconds all requests spent waiting."""
+
+    max_wait: float
+    """The longest wait in seconds."""
+
+
+class RateLimiter:
+    """A GCRA rate limiter pacing requests to an upstream quota.
+
+    Callers over the quota are delayed instead of rejected. The pace adapts to
+    the `X-RateLimit-*` and `Retry-After` headers of upstream responses.
+    """
+
+    __slots__ = (
+        "_acquired",
+        "_base_interval",
+        "_blocked_until",
+        "_delayed",
+        "_interval",
+        "_max_wait",
+        "_theoretical_arrival",
+        "_tolerance",
+        "_total_wait",
+    )
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize new limiter with a rate and a burst size.
+
+        Args:
+            rate (float): Maximum number of requests per second.
+            burst (int): Number of requests that can be sent at once.
+                Defaults to `1`.
+        """
+        self._base_interval: float = 1 / rate
+        self._interval: float = self._base_interval
+        self._tolerance: float = self._base_interval * (burst - 1)
+        self._theoretical_arrival: float = 0.0
+        self._blocked_until: float = 0.0
+        self._acquired: int = 0
+        self._delayed: int = 0
+        self._total_wait: float = 0.0
+        self._max_wait: float = 0.0
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """The wait time statistics."""
+        return RateLimiterStats(
+            acquired=self._acquired,
+            delayed=self._delayed,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
+
+    async def acquire(self) -> float:
+        """Wait until a request can be sent.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        now = time.monotonic()
+        send_at = max(
+            now, self._theoretical_arrival - self._tolerance, self._blocked_until
+        )
+        self._theoretical_arrival = (
+            max(self._theoretical_arrival, send_at) + self._interval
+        )
+
+        wait = send_at - now
+        self._acquired += 1
+        if wait > 0:
+            self._delayed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Learn the upstream quota from response headers.
+
+        `Retry-After`, or an exhausted `X-RateLimit-Remaining`, blocks requests
+        until the upstream accepts them again. A remaining quota is spread evenly
+        until `X-RateLimit-Reset`, but never faster than the configured rate.
+
+        Args:
+            headers (Mapping[str, str]): The response headers.
+        """
+        now = time.monotonic()
+        if (after := retry_after(headers)) is not None:
+            self._blocked_until = max(self._blocked_until, now + after)
+
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+
+        if reset > _EPOCH_THRESHOLD:
+            reset = max(reset - time.time(), 0.0)
+
+        if remaining <= 0:
+            self._blocked_until = max(self._blocked_until, now + reset)
+        else:
+            self._interval = max(self._base_interval, reset / remaining)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Collection, Mapping
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from .abc import Request
+
+__all__ = ["RetryBudget", "RetryPolicy", "retry_after"]
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Parse the `Retry-After` header.
+
+    Args:
+        headers (Mapping[str, str]): The response headers.
+
+    Returns:
+        Seconds to wait, or `None` if the header is missing or malformed.
+    """
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryBudget:
+    """A token bucket limiting how many retries can be made.
+
+    Every retry takes a token from the bucket, which refills at a constant rate,
+    so retries cannot multiply the load on an upstream that is already failing.
+    """
+
+    __slots__ = ("_capacity", "_refill_rate", "_tokens", "_updated_at")
+
+    def __init__(self, capacity: float = 10.0, refill_rate: float = 1.0):
+        """Initialize new full budget.
+
+        Args:
+            capacity (float): Maximum number of retries that can be made in a burst.
+                Defaults to `10.0`.
+            refill_rate (float): Number of retries added to the budget per second.
+                Defaults to `1.0`.
+        """
+        self._capacity: float = capacity
+        self._refill_rate: float = refill_rate
+        self._tokens: float = capacity
+        self._updated_at: float = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """The number of retries currently available."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._refill_rate
+        )
+        self._updated_at = now
+        return self._tokens
+
+    def withdraw(self) -> bool:
+        """Take a token for a retry.
+
+        Returns:
+            `True` if the retry is within the budget; `False` otherwise.
+        """
+        if self.tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """A policy deciding whether and when a failed request is retried.
+
+    Delays grow exponentially with full jitter, unless the response specifies
+    a `Retry-After`. Only idempotent requests are retried.
+    """
+
+    __slots__ = ("_base_delay", "_budget", "_max_attempts", "_max_delay", "_statuses")
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        retry_statuses: Collection[int] = (429, 502, 503, 504),
+        budget: RetryBudget | None = None,
+    ):
+        """Initialize new policy.
+
+        Args:
+            max_attempts (int): Maximum number of attempts, including the first one.
+                Defaults to `3`.
+            base_delay (float): Upper bound in seconds of the first retry delay,
+                doubled with every attempt. Defaults to `0.1`.
+            max_delay (float): Maximum delay in seconds. Responses asking to retry
+                later than that are not retried. Defaults to `10.0`.
+            retry_statuses (Collection[int]): Response status codes that are retried.
+                Defaults to `(429, 502, 503, 504)`.
+            budget (RetryBudget | None): The budget shared by all retries.
+                Defaults to a new `RetryBudget`.
+        """
+        self._max_attempts: int = max_attempts
+        self._base_delay: float = base_delay
+        self._max_delay: float = max_delay
+        self._statuses: frozenset[int] = frozenset(retry_statuses)
+        self._budget: RetryBudget = budget or RetryBudget()
+
+    def delay(
+        self, request: Request, attempt: int, response: httpx.Response | None = None
+    ) -> float | None:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            request (Request): The request that failed.
+            attempt (int): The number of attempts made so far.
+            response (httpx.Response | None): The response of the failed attempt,
+                or `None` if the attempt failed with a transport error.
+                Defaults to `None`.
+
+        Returns:
+            Seconds to wait before retrying, or `None` if the request must not be
+            retried.
+        """
+        if attempt >= self._max_attempts or not request.idempotent:
+            return None
+
+        if response is not None and response.status_code not in self._statuses:
+            return None
+
+        delay = random.uniform(
+            0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+        )
+        if response is not None and (after := retry_after(response.headers)) is not None:
+            delay = after
+
+        if delay > self._max_delay or not self._budget.withdraw():
+            return None
+        return delay
@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import time
+from collections.abc import Collection, Iterator, Sequence
+from itertools import cycle
+from pathlib import Path
+from typing import IO, NamedTuple, cast
+
+import httpx
+
+__all__ = [
+    "CapturedExchange",
+    "LoadReport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "generate_load",
+    "read_capture",
+]
+
+
+_UNREPLAYED_HEADERS = frozenset({"content-length", "host", "transfer-encoding"})
+"""Request headers recomputed by the client instead of being replayed."""
+
+_SENSITIVE_HEADERS = frozenset(
+    {"authorization", "cookie", "proxy-authorization", "set-cookie", "x-api-key"}
+)
+"""Headers left out of captures by default, as they carry credentials."""
+
+
+class CapturedExchange(NamedTuple):
+    """A single request and response captured by the `RecordingTransport`."""
+
+    start: float
+    """Seconds between the start of the capture and sending the request.
+
+    Captured as wall-clock time and made relative to the earliest exchange by
+    `read_capture`.
+    """
+
+    duration: float
+    """Seconds it took to receive the response."""
+
+    method: str
+    url: str
+    request_headers: list[tuple[str, str]]
+    request_body: bytes
+    status_code: int
+    response_headers: list[tuple[str, str]]
+    response_body: bytes
+
+    def to_line(self) -> str:
+        """Serialize the exchange to a single line of JSON."""
+        return json.dumps(
+            [
+                round(self.start, 6),
+                round(self.duration, 6),
+                self.method,
+                self.url,
+                self.request_headers,
+                base64.b64encode(self.request_body).decode(),
+                self.status_code,
+                self.response_headers,
+                base64.b64encode(self.response_body).decode(),
+            ],
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> CapturedExchange:
+        """Deserialize an exchange from a line written by `to_line`."""
+        (
+            start,
+            duration,
+            method,
+            url,
+            request_headers,
+            request_body,
+            status_code,
+            response_headers,
+            response_body,
+        ) = json.loads(line)
+        return cls(
+            start=start,
+            duration=duration,
+            method=method,
+            url=url,
+            request_headers=[tuple(header) for header in request_headers],
+            request_body=base64.b64decode(request_body),
+            status_code=status_code,
+            response_headers=[tuple(header) for header in response_headers],
+            response_body=base64.b64decode(response_body),
+        )
+
+
+def read_capture(path: str | Path) -> list[CapturedExchange]:
+    """Read all exchanges from a capture file.
+
+    Args:
+        path (str | Path): The capture file written by a `RecordingTransport`.
+
+    Returns:
+        The captured exchanges ordered by their start time, which is relative to
+        the earliest exchange in the file.
+    """
+    with Path(path).open(encoding="utf-8") as file:
+        exchanges = [CapturedExchange.from_line(line) for line in file if line.strip()]
+    first_start = min((exchange.start for exchange in exchanges), default=0.0)
+    return sorted(
+        (exchange._replace(start=exchange.start - first_start) for exchange in exchanges),
+        key=lambda exchange: exchange.start,
+    )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """A transport that captures traffic of another transport to a file.
+
+    Every exchange is appended to the capture file as one line of compact JSON,
+    so the file can be grown across runs; exchanges are timestamped with the
+    wall-clock time, so sessions keep their real distance in time. Lines are
+    buffered and written to disk in blocks instead of being flushed on every
+    request, so the event loop is not blocked by file I/O; call `aclose` to flush
+    the remaining lines.
+
+    Headers carrying credentials are left out of the capture by default.
+    """
+
+    __slots__ = ("_file", "_redacted_headers", "_transport")
+
+    def __init__(
+        self,
+        path: str | Path,
+        transport: httpx.AsyncBaseTransport | None = None,
+        redacted_headers: Collection[str] | None = None,
+    ):
+        """Initialize new transport with a capture file and a wrapped transport.
+
+        Args:
+            path (str | Path): The file to append captured exchanges to.
+            transport (httpx.AsyncBaseTransport | None): The transport that sends
+                requests. Defaults to `httpx.AsyncHTTPTransport`.
+            redacted_headers (Collection[str] | None): Names of request and response
+                headers left out of the capture; pass an empty collection to capture
+                every header. Defaults to `None`, which leaves out `Authorization`,
+                `Cookie`, `Proxy-Authorization`, `Set-Cookie` and `X-Api-Key`.
+        """
+        self._transport: httpx.AsyncBaseTransport = (
+            transport or httpx.AsyncHTTPTransport()
+        )
+        self._redacted_headers: frozenset[str] = (
+            _SENSITIVE_HEADERS
+            if redacted_headers is None
+            else frozenset(name.lower() for name in redacted_headers)
+        )
+        self._file: IO[str] = Path(path).open("a", encoding="utf-8")  # noqa: SIM115
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request using the wrapped transport and capture the exchange.
+
+        Args:
+            request (httpx.Request): The request to send.
+
+        Returns:
+            The response with its raw body already read.
+        """
+        request_body = await request.aread()
+        started_at = time.time()
+        sent_at = time.perf_counter()
+
+        response = await self._transport.handle_async_request(request)
+        try:
+            stream = cast(httpx.AsyncByteStream, response.stream)
+            response_body = b"".join([chunk async for chunk in stream])
+        finally:
+            await response.aclose()
+
+        exchange = CapturedExchange(
+            start=started_at,
+            duration=time.perf_counter() - sent_at,
+            method=request.method,
+            url=str(request.url),
+            request_headers=self._captured_headers(request.headers),
+            request_body=request_body,
+            status_code=response.status_code,
+            response_headers=self._captured_headers(response.headers),
+            response_body=response_body,
+        )
+        self._file.write(exchange.to_line() + "\n")
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response_body,
+            extensions=response.extensions,
+        )
+
+    def _captured_headers(self, headers: httpx.Headers) -> list[tuple[str, str]]:
+        return [
+            (name, value)
+            for name, value in headers.multi_items()
+            if name.lower() not in self._redacted_headers
+        ]
+
+    async def aclose(self) -> None:
+        """Flush and close the capture file, and close the wrapped transport."""
+        self._file.close()
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """A transport that answers requests with previously captured responses.
+
+    Responses are matched by method and URL, and served in the order they were
+    captured; once exhausted, they are served again from the first one.
+    Requests without a captured response are answered with `404 Not Found`.
+    """
+
+    __slots__ = ("_responses", "_simulate_latency", "_speed")
+
+    def __init__(
+        self,
+        exchanges: Sequence[CapturedExchange],
+        simulate_latency: bool = False,
+        speed: float = 1.0,
+    ):
+        """Initialize new transport with captured exchanges.
+
+        Args:
+            exchanges (Sequence[CapturedExchange]): The exchanges to replay.
+            simulate_latency (bool): Whether to delay responses by their captured
+                duration. Defaults to `False`.
+            speed (float): The factor the captured durations are divided by.
+                Defaults to `1.0`.
+        """
+        grouped: dict[tuple[str, str], list[CapturedExchange]] = {}
+        for exchange in exchanges:
+            grouped.setdefault((exchange.method, exchange.url), []).append(exchange)
+
+        self._responses: dict[tuple[str, str], Iterator[CapturedExchange]] = {
+            key: cycle(captured) for key, captured in grouped.items()
+        }
+        self._simulate_latency: bool = simulate_latency
+        self._speed: float = speed
+
+    @classmethod
+    def from_file(
+        cls, path: str | Path, simulate_latency: bool = False, speed: float = 1.0
+    ) -> ReplayTransport:
+        """Create new transport replaying a capture file.
+
+        Args:
+            path (str | Path): The capture file written by a `RecordingTransport`.
+            simulate_latency (bool): Whether to delay responses by their captured
+                duration. Defaults to `False`.
+            speed (float): The factor the captured durations are divided by.
+                Defaults to `1.0`.
+
+        Returns:
+            The replay transport.
+        """
+        return cls(read_capture(path), simulate_latency=simulate_latency, speed=speed)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer the request with the next matching captured response.
+
+        Args:
+            request (httpx.Request): The request to answer.
+
+        Returns:
+            The captured response, or `404 Not Found` if there is none.
+        """
+        responses = self._responses.get((request.method, str(request.url)))
+        if responses is None:
+            return httpx.Response(status_code=404)
+
+        exchange = next(responses)
+        if self._simulate_latency:
+            await asyncio.sleep(exchange.duration / self._speed)
+
+        return httpx.Response(
+            status_code=exchange.status_code,
+            headers=exchange.response_headers,
+            content=exchange.response_body,
+        )
+
+
+class LoadReport(NamedTuple):
+    """Throughput and latency measured by `generate_load`."""
+
+    requests: int
+    """The number of requests sent."""
+
+    errors: int
+    """The number of requests that failed or were answered with an error status."""
+
+    elapsed: float
+    """Seconds between sending the first request and receiving the last response."""
+
+    p50: float
+    """The median latency in seconds."""
+
+    p90: float
+    """The 90th percentile latency in seconds."""
+
+    p99: float
+    """The 99th percentile latency in seconds."""
+
+    @property
+    def throughput(self) -> float:
+        """Requests completed per second."""
+        return self.requests / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+async def generate_load(
+    exchanges: Sequence[CapturedExchange],
+    client: httpx.AsyncClient,
+    speed: float = 1.0,
+    base_url: str | None = None,
+) -> LoadReport:
+    """Replay captured requests with their original pacing and measure the results.
+
+    Each request is sent at its captured start time divided by `speed`, so `1.0`
+    replays the workload in real time and larger values accelerate it.
+
+    The captured requests are sent as raw HTTP exchanges with the `client`, so
+    retry policies, rate limiters, `map_response` and interactors are not
+    exercised. To measure those, run the interactors with an `HttpClient` whose
+    `httpx.AsyncClient` uses a `ReplayTransport`.
+
+    Args:
+        exchanges (Sequence[CapturedExchange]): The captured exchanges to replay.
+        client (httpx.AsyncClient): The client to send the requests with.
+        speed (float): The replay rate relative to the capture. Defaults to `1.0`.
+        base_url (str | None): Optional origin replacing the captured one, e.g.
+            of a local stand-in server. Defaults to `None`.
+
+    Returns:
+        The load report.
+    """
+    target = httpx.URL(base_url) if base_url else None
+    first_start = min((exchange.start for exchange in exchanges), default=0.0)
+    latencies: list[float] = []
+    errors = 0
+
+    async def replay(exchange: CapturedExchange, started_at: float) -> None:
+        nonlocal errors
+        delay = (exchange.start - first_start) / speed - (
+            time.perf_counter() - started_at
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        url = httpx.URL(exchange.url)
+        if target is not None:
+            url = url.copy_with(scheme=target.scheme, host=target.host, port=target.port)
+
+        sent_at = time.perf_counter()
+        try:
+            response = await client.request(
+                exchange.method,
+                url,
+                headers=[
+                    (name, value)
+                    for name, value in exchange.request_headers
+                    if name.lower() not in _UNREPLAYED_HEADERS
+                ],
+                content=exchange.request_body,
+            )
+            if response.is_error:
+                errors += 1
+        except httpx.HTTPError:
+            errors += 1
+        latencies.append(time.perf_counter() - sent_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(replay(exchange, started_at) for exchange in exchanges))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return LoadReport(
+        requests=len(exchanges),
+        errors=errors,
+        elapsed=elapsed,
+        p50=_percentile(latencies, 50),
+        p90=_percentile(latencies, 90),
+        p99=_percentile(latencies, 99),
+    )
+
+
+async def _run(args: argparse.Namespace) -> LoadReport:
+    exchanges = read_capture(args.capture)
+    transport = (
+        None if args.base_url else ReplayTransport(exchanges, simulate_latency=True)
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await generate_load(
+            exchanges, client, speed=args.speed, base_url=args.base_url
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Replay a capture file and print the load report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m httperactor.traffic",
+        description="Replay captured traffic and report throughput and latency.",
+    )
+    parser.add_argument("capture", help="capture file written by RecordingTransport")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="replay rate relative to the capture"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="origin of the server to replay against; "
+        "defaults to an in-process stand-in answering with the captured responses",
+    )
+    report = asyncio.run(_run(parser.parse_args(argv)))
+
+    print(f"requests:   {report.requests} ({report.errors} errors)")
+    print(f"elapsed:    {report.elapsed:.3f}s")
+    print(f"throughput: {report.throughput:.1f} req/s")
+    print(
+        f"latency:    p50={report.p50 * 1000:.1f}ms p90={report.p90 * 1000:.1f}ms "
+        f"p99={report.p99 * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
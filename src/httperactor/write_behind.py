@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Generic, TypeVar, cast
+
+from .abc import AuthMiddleware, HttpClientBase, Request
+from .http_method import HttpMethod
+
+__all__ = ["WriteBehindQueue"]
+
+
+TSubRequest = TypeVar("TSubRequest")
+"""Invariant type variable for a generic request."""
+
+TResponse = TypeVar("TResponse")
+"""Invariant type variable for a generic response."""
+
+
+class _CoalescedRequest(Request[TResponse]):
+    """A request sending a merged body on behalf of another request."""
+
+    __slots__ = ("_request", "_body")
+
+    def __init__(self, request: Request[TResponse], body: list | dict | None):
+        self._request: Request[TResponse] = request
+        self._body: list | dict | None = body
+
+    @property
+    def path(self) -> str:
+        return self._request.path
+
+    @property
+    def body(self) -> list | dict | None:
+        return self._body
+
+    @property
+    def headers(self) -> list[tuple[str, str]]:
+        return self._request.headers
+
+    @property
+    def method(self) -> HttpMethod:
+        return self._request.method
+
+    @property
+    def idempotent(self) -> bool:
+        return self._request.idempotent
+
+    @property
+    def rate_limit_class(self) -> type[Request]:
+        return self._request.rate_limit_class
+
+    def map_response(self, response: str) -> TResponse:
+        return self._request.map_response(response)
+
+
+def _compose_merge_patches(first: dict, second: dict) -> dict | None:
+    """Combine two JSON merge patches (RFC 7396) into one with the same effect.
+
+    Returns `None` if `second` patches an object into a key that `first` replaces
+    with a non-object value or `null`, which a single merge patch cannot express.
+    """
+    composed = dict(first)
+    for key, value in second.items():
+        if isinstance(value, dict) and key in first:
+            if not isinstance(first[key], dict):
+                return None
+            nested = _compose_merge_patches(first[key], value)
+            if nested is None:
+                return None
+            composed[key] = nested
+        else:
+            composed[key] = value
+    return composed
+
+
+def _apply_merge_patch(target: object, patch: object) -> object:
+    """Apply a JSON merge patch (RFC 7396) to a document, removing `null` members."""
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = _apply_merge_patch(result.get(key), value)
+    return result
+
+
+class _PendingWrite:
+    """A queued write together with the futures of every caller it carries."""
+
+    __slots__ = ("request", "body", "futures")
+
+    def __init__(self, request: Request, future: asyncio.Future[bool]):
+        self.request: Request = request
+        self.body: list | dict | None = request.body
+        self.futures: list[asyncio.Future[bool]] = [future]
+
+    def merge(self, request: Request) -> bool:
+        """Merge the body of a `PATCH` request into this write.
+
+        Dictionaries are treated as JSON merge patches (RFC 7396): they are merged
+        recursively, and applying one to a `PUT` body removes the members set to
+        `null`. Lists (e.g. JSON Patch operations) are concatenated when both
+        writes are `PATCH`es.
+
+        Args:
+            request (Request): The `PATCH` request to merge.
+
+        Returns:
+            `True` if the bodies were merged; `False` otherwise.
+        """
+        body = request.body
+        if isinstance(self.body, dict) and isinstance(body, dict):
+            if self.request.method == HttpMethod.PUT:
+                self.body = cast(dict, _apply_merge_patch(self.body, body))
+            else:
+                composed = _compose_merge_patches(self.body, body)
+                if composed is None:
+                    return False
+                self.body = composed
+        elif (
+            self.request.method == HttpMethod.PATCH
+            and isinstance(self.body, list)
+            and isinstance(body, list)
+        ):
+            self.body = [*self.body, *body]
+        else:
+            return False
+
+        if self.request.method == HttpMethod.PATCH:
+            self.request = request
+        return True
+
+
+class WriteBehindQueue(Generic[TSubRequest]):
+    """A queue that delays, coalesces and sends mutation requests in batches."""
+
+    __slots__ = (
+        "_auth",
+        "_flush_lock",
+        "_http_client",
+        "_max_delay",
+        "_max_pending",
+        "_pending",
+        "_pending_count",
+        "_semaphore",
+        "_tasks",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        http_client: HttpClientBase[TSubRequest],
+        auth: AuthMiddleware[TSubRequest] | None = None,
+        max_delay: float = 0.1,
+        max_pending: int = 100,
+        max_concurrency: int = 4,
+    ):
+        """Initialize new queue with an HTTP client and flush triggers.
+
+        Args:
+            http_client (HttpClientBase[TSubRequest]): The HTTP client to use for sending
+                requests.
+            auth (AuthMiddleware[TSubRequest] | None): Optional auth middleware applied
+                to every write. Defaults to `None`.
+            max_delay (float): Seconds a write can wait before the queue is flushed.
+                Defaults to `0.1`.
+            max_pending (int): Number of pending writes that triggers a flush.
+                Defaults to `100`.
+            max_concurrency (int): Maximum number of writes sent at the same time.
+                Defaults to `4`.
+        """
+        self._http_client: HttpClientBase[TSubRequest] = http_client
+        self._auth: AuthMiddleware[TSubRequest] | None = auth
+        self._max_delay: float = max_delay
+        self._max_pending: int = max_pending
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._pending: dict[str, list[_PendingWrite]] = {}
+        self._pending_count: int = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """The number of writes waiting to be flushed."""
+        return self._pending_count
+
+    def submit(self, request: Request) -> asyncio.Future[bool]:
+        """Queue a `PATCH` or `PUT` request.
+
+        A `PATCH` is merged into the pending write for the same path when the bodies
+        are compatible. A `PUT` supersedes every pending write for the same path.
+
+        Args:
+            request (Request): The mutation request to queue.
+
+        Returns:
+            A future resolved once the write carrying the request's data is sent,
+            with `True` if the client returned a response; `False` otherwise.
+
+        Raises:
+            ValueError: If the request method is neither `PATCH` nor `PUT`.
+        """
+        if request.method not in (HttpMethod.PATCH, HttpMethod.PUT):
+            raise ValueError(request.method)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        self._enqueue(request, future)
+
+        if self._pending_count >= self._max_pending:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._schedule_flush)
+
+        return future
+
+    async def flush(self) -> None:
+        """Send all pending writes.
+
+        Writes for different paths are sent concurrently, bounded by `max_concurrency`;
+        writes for the same path are sent in the order they were queued.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, {}
+        self._pending_count = 0
+
+        async with self._flush_lock:
+            await asyncio.gather(
+                *(self._send_writes(writes) for writes in pending.values())
+            )
+
+    async def close(self) -> None:
+        """Flush the queue and wait for all scheduled flushes to finish."""
+        await self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _enqueue(self, request: Request, future: asyncio.Future[bool]) -> None:
+        writes = self._pending.setdefault(request.path, [])
+
+        if request.method == HttpMethod.PUT:
+            write = _PendingWrite(request, future)
+            write.futures[:0] = [f for superseded in writes for f in superseded.futures]
+            self._pending_count -= len(writes)
+            writes[:] = [write]
+            self._pending_count += 1
+        elif writes and writes[-1].merge(request):
+            writes[-1].futures.append(future)
+        else:
+            writes.append(_PendingWrite(request, future))
+            self._pending_count += 1
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_writes(self, writes: list[_PendingWrite]) -> None:
+        for write in writes:
+            async with self._semaphore:
+                try:
+                    response = await self._http_client.send(
+                        _CoalescedRequest(write.request, write.body), auth=self._auth
+                    )
+                except Exception as error:
+                    for future in write.futures:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+
+            for future in write.futures:
+                if not future.done():
+                    future.set_result(response is not None)
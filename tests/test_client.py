@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from unittest.mock import AsyncMock, Mock, PropertyMock, call, create_autospec
+from unittest.mock import AsyncMock, Mock, PropertyMock, call, create_autospec, patch
 
 import httpx
 import pytest
@@ -7,6 +7,8 @@ import pytest
 from src.httperactor.abc import AuthMiddleware, ErrorHandler, Request
 from src.httperactor.client import HttpClient
 from src.httperactor.http_method import HttpMethod
+from src.httperactor.rate_limiter import RateLimiter
+from src.httperactor.retry import RetryPolicy
 
 
 @pytest.fixture()
@@ -189,3 +191,133 @@ class TestSend:
         result = await sut.send(create_request())
 
         assert not result
+
+
+@pytest.fixture()
+def sleep():
+    with patch("src.httperactor.client.asyncio.sleep", new=AsyncMock()) as patched:
+        yield patched
+
+
+@pytest.fixture()
+def create_mock_sut(error_handler) -> Callable[..., HttpClient]:
+    def factory(responses: list[httpx.Response | Exception], **kwargs) -> HttpClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        httpx_client = httpx.AsyncClient(
+            base_url="http://test", transport=httpx.MockTransport(handler)
+        )
+        return HttpClient(httpx_client, error_handler=error_handler, **kwargs)
+
+    return factory
+
+
+class GetRequest(Request[str]):
+    @property
+    def path(self) -> str:
+        return "/foo"
+
+    def map_response(self, response: str) -> str:
+        return response
+
+
+class PostRequest(GetRequest):
+    @property
+    def method(self) -> HttpMethod:
+        return HttpMethod.POST
+
+
+@pytest.mark.asyncio()
+class TestSendWithRetryPolicy:
+    async def test_retries_retryable_status_until_success(self, create_mock_sut, sleep):
+        sut = create_mock_sut(
+            [httpx.Response(503), httpx.Response(200, text="foo")],
+            retry_policy=RetryPolicy(),
+        )
+
+        assert await sut.send(GetRequest()) == "foo"
+        sleep.assert_awaited_once()
+
+    async def test_retries_transport_errors(self, create_mock_sut, sleep):
+        sut = create_mock_sut(
+            [httpx.ConnectError("reset"), httpx.Response(200, text="foo")],
+            retry_policy=RetryPolicy(),
+        )
+
+        assert await sut.send(GetRequest()) == "foo"
+
+    async def test_when_attempts_exhausted__handles_last_error(
+        self, create_mock_sut, error_handler, sleep
+    ):
+        sut = create_mock_sut(
+            [httpx.Response(503)] * 2, retry_policy=RetryPolicy(max_attempts=2)
+        )
+
+        assert await sut.send(GetRequest()) is None
+        error = error_handler.handle.await_args.args[0]
+        assert isinstance(error, httpx.HTTPStatusError)
+
+    async def test_does_not_retry_non_idempotent_request(
+        self, create_mock_sut, error_handler, sleep
+    ):
+        sut = create_mock_sut(
+            [httpx.ConnectError("reset"), httpx.Response(200)],
+            retry_policy=RetryPolicy(),
+        )
+
+        assert await sut.send(PostRequest()) is None
+        sleep.assert_not_awaited()
+
+    async def test_without_policy__does_not_retry(self, create_mock_sut, sleep):
+        sut = create_mock_sut([httpx.Response(503), httpx.Response(200)])
+
+        assert await sut.send(GetRequest()) is None
+
+
+@pytest.mark.asyncio()
+class TestSendWithRateLimiters:
+    async def test_acquires_limiter_registered_for_request_class(self, create_mock_sut):
+        limiter = create_autospec(RateLimiter)
+        sut = create_mock_sut([httpx.Response(200)], rate_limiters={GetRequest: limiter})
+
+        await sut.send(PostRequest())
+
+        limiter.acquire.assert_awaited_once_with()
+
+    async def test_acquires_limiter_registered_for_rate_limit_class(
+        self, create_mock_sut
+    ):
+        class DelegatingRequest(GetRequest):
+            @property
+            def rate_limit_class(self) -> type[Request]:
+                return PostRequest
+
+        limiter = create_autospec(RateLimiter)
+        sut = create_mock_sut([httpx.Response(200)], rate_limiters={PostRequest: limiter})
+
+        await sut.send(DelegatingRequest())
+
+        limiter.acquire.assert_awaited_once_with()
+
+    async def test_acquires_limiter_registered_for_host(self, create_mock_sut):
+        limiter = create_autospec(RateLimiter)
+        sut = create_mock_sut([httpx.Response(200)], rate_limiters={"test": limiter})
+
+        await sut.send(GetRequest())
+
+        limiter.acquire.assert_awaited_once_with()
+
+    async def test_updates_limiter_with_response_headers(self, create_mock_sut):
+        limiter = create_autospec(RateLimiter)
+        sut = create_mock_sut(
+            [httpx.Response(200, headers={"Retry-After": "1"})],
+            rate_limiters={"test": limiter},
+        )
+
+        await sut.send(GetRequest())
+
+        assert limiter.update.call_args.args[0]["retry-after"] == "1"
@@ -0,0 +1,179 @@
+import asyncio
+import os
+from collections.abc import Sequence
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+from pydepot import Action, Store
+
+from src.httperactor.abc import AuthMiddleware, HttpClientBase, Request
+from src.httperactor.executor import ShardedExecutor
+from src.httperactor.interactor import HttpInteractor
+
+
+class EchoHttpClient(HttpClientBase):
+    async def send(self, request: Request, auth: AuthMiddleware | None = None) -> Any:
+        return request.path
+
+
+class PathRequest(Request[str]):
+    def __init__(self, path: str):
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def map_response(self, response: str) -> str:
+        return response
+
+
+class ReceivedAction(Action):
+    def __init__(self, path: str, pid: int):
+        self.path = path
+        self.pid = pid
+
+
+class EchoInteractor(HttpInteractor):
+    def __init__(self, http_client: HttpClientBase, store: Store, path: str):
+        super().__init__(http_client, store)
+        self._path = path
+
+    @property
+    def request(self) -> Request:
+        return PathRequest(self._path)
+
+    def actions(self, response: str) -> Sequence[Action]:
+        return [ReceivedAction(response, os.getpid())]
+
+
+class FailingInteractor(EchoInteractor):
+    async def side_effects(self, response: str) -> None:
+        raise ValueError(response)
+
+
+class StateInteractor(EchoInteractor):
+    def actions(self, response: str) -> Sequence[Action]:
+        return [ReceivedAction(f"{self.store.state}{response}", os.getpid())]
+
+
+class CrashingInteractor(EchoInteractor):
+    async def side_effects(self, response: str) -> None:
+        os._exit(1)
+
+
+class RecordingStore(Store[Any]):
+    __slots__ = ("actions",)
+
+    def __init__(self, state: Any = None):
+        super().__init__(initial_state=state)
+        self.actions: list[ReceivedAction] = []
+
+    def dispatch(self, action: Action) -> None:
+        self.actions.append(action)
+
+
+class RaisingStore(RecordingStore):
+    __slots__ = ()
+
+    def dispatch(self, action: Action) -> None:
+        if action.path == "/foo":
+            raise ValueError(action.path)
+        super().dispatch(action)
+
+
+@pytest.fixture()
+def store() -> RecordingStore:
+    return RecordingStore()
+
+
+@pytest.mark.asyncio()
+class TestShardedExecutor:
+    async def test_dispatches_actions_to_store(self, store):
+        async with ShardedExecutor(store, EchoHttpClient, workers=2) as sut:
+            await sut.execute(EchoInteractor, "/foo")
+
+        assert [action.path for action in store.actions] == ["/foo"]
+        assert store.actions[0].pid != os.getpid()
+
+    async def test_spreads_interactors_across_workers(self, store):
+        async with ShardedExecutor(store, EchoHttpClient, workers=2) as sut:
+            await asyncio.gather(
+                *(sut.submit(EchoInteractor, f"/{index}") for index in range(4))
+            )
+
+        assert len({action.pid for action in store.actions}) == 2
+
+    async def test_runs_interactors_with_equal_keys_in_same_worker(self, store):
+        async with ShardedExecutor(store, EchoHttpClient, workers=4) as sut:
+            await asyncio.gather(
+                *(sut.submit(EchoInteractor, f"/{i}", key="foo") for i in range(8))
+            )
+
+        assert len({action.pid for action in store.actions}) == 1
+
+    async def test_dispatches_actions_in_submission_order_per_key(self, store):
+        async with ShardedExecutor(
+            store, EchoHttpClient, workers=2, max_batch_size=3
+        ) as sut:
+            for index in range(10):
+                sut.submit(EchoInteractor, f"/{index}", key="foo")
+
+        assert [action.path for action in store.actions] == [
+            f"/{index}" for index in range(10)
+        ]
+
+    async def test_when_interactor_raises__sets_exception_on_future(self, store):
+        async with ShardedExecutor(store, EchoHttpClient, workers=1) as sut:
+            failing = sut.submit(FailingInteractor, "/foo")
+            succeeding = sut.submit(EchoInteractor, "/bar")
+
+            with pytest.raises(ValueError, match="/foo"):
+                await failing
+            await succeeding
+
+        assert [action.path for action in store.actions] == ["/bar"]
+
+    async def test_when_store_raises__fails_only_that_interactor(self):
+        store = RaisingStore()
+
+        async with ShardedExecutor(store, EchoHttpClient, workers=1) as sut:
+            failing = sut.submit(EchoInteractor, "/foo")
+            succeeding = sut.submit(EchoInteractor, "/bar")
+
+            with pytest.raises(ValueError, match="/foo"):
+                await failing
+            await succeeding
+            await sut.execute(EchoInteractor, "/baz")
+
+        assert [action.path for action in store.actions] == ["/bar", "/baz"]
+
+    async def test_when_share_state__worker_store_holds_snapshot_of_parent_state(
+        self,
+    ):
+        store = RecordingStore(state="state")
+
+        async with ShardedExecutor(
+            store, EchoHttpClient, workers=1, share_state=True
+        ) as sut:
+            await sut.execute(StateInteractor, "/foo")
+
+        assert [action.path for action in store.actions] == ["state/foo"]
+
+    async def test_worker_state_is_none_by_default(self):
+        store = RecordingStore(state="state")
+
+        async with ShardedExecutor(store, EchoHttpClient, workers=1) as sut:
+            await sut.execute(StateInteractor, "/foo")
+
+        assert [action.path for action in store.actions] == ["None/foo"]
+
+    async def test_when_worker_dies__replaces_it_for_later_batches(self, store):
+        async with ShardedExecutor(store, EchoHttpClient, workers=1) as sut:
+            with pytest.raises(BrokenProcessPool):
+                await sut.execute(CrashingInteractor, "/foo")
+
+            await sut.execute(EchoInteractor, "/bar")
+
+        assert [action.path for action in store.actions] == ["/bar"]
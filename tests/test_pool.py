@@ -0,0 +1,226 @@
+import asyncio
+from unittest.mock import AsyncMock, create_autospec, patch
+
+import httpx
+import pytest
+
+from src.httperactor.abc import ErrorHandler, Request
+from src.httperactor.client import HttpClient
+from src.httperactor.pool import HttpClientPool, PoolStats
+from src.httperactor.rate_limiter import RateLimiter
+from src.httperactor.retry import RetryPolicy
+
+
+@pytest.fixture()
+def received() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture()
+def transport(received):
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(200)
+
+    with patch(
+        "src.httperactor.pool.httpx.AsyncHTTPTransport",
+        side_effect=lambda **kwargs: httpx.MockTransport(handler),
+    ) as patched:
+        yield patched
+
+
+@pytest.fixture()
+def error_handler() -> ErrorHandler:
+    return create_autospec(ErrorHandler)
+
+
+@pytest.mark.asyncio()
+class TestClient:
+    async def test_returns_http_client(self, transport):
+        async with HttpClientPool() as sut:
+            assert isinstance(await sut.client("http://foo"), HttpClient)
+
+    async def test_shares_client_per_base_url(self, transport):
+        async with HttpClientPool() as sut:
+            first = await sut.client("http://foo")
+            second = await sut.client("http://foo")
+            other = await sut.client("http://bar")
+
+        assert first is second
+        assert first is not other
+
+    async def test_builds_transport_with_limits(self, transport):
+        async with HttpClientPool(max_connections=10, http2=True) as sut:
+            await sut.client("http://foo")
+
+        kwargs = transport.call_args.kwargs
+        assert kwargs["limits"].max_connections == 10
+        assert kwargs["http2"]
+
+    async def test_configures_clients_with_retry_policy_and_rate_limiters(self):
+        responses = [httpx.Response(503), httpx.Response(200, text="foo")]
+        limiter = create_autospec(RateLimiter)
+
+        class GetRequest(Request[str]):
+            @property
+            def path(self) -> str:
+                return "/"
+
+            def map_response(self, response: str) -> str:
+                return response
+
+        with patch(
+            "src.httperactor.pool.httpx.AsyncHTTPTransport",
+            side_effect=lambda **kwargs: httpx.MockTransport(
+                lambda request: responses.pop(0)
+            ),
+        ), patch("src.httperactor.client.asyncio.sleep", new=AsyncMock()):
+            async with HttpClientPool(
+                retry_policy=RetryPolicy(), rate_limiters={"foo": limiter}
+            ) as sut:
+                http_client = await sut.client("http://foo")
+
+                assert await http_client.send(GetRequest()) == "foo"
+
+        assert limiter.acquire.await_count == 2
+
+    async def test_warms_up_connections_with_head_probes(self, transport, received):
+        async with HttpClientPool(warmup_connections=3, probe_path="/health") as sut:
+            await sut.client("http://foo")
+
+        assert [(r.method, str(r.url)) for r in received] == [
+            ("HEAD", "http://foo/health")
+        ] * 3
+
+    async def test_caps_warm_up_at_max_keepalive_connections(self, transport, received):
+        async with HttpClientPool(
+            warmup_connections=10, max_keepalive_connections=2
+        ) as sut:
+            await sut.client("http://foo")
+
+        assert len(received) == 2
+
+    async def test_when_probe_fails__calls_handle_on_error_handler(self, error_handler):
+        expected_error = httpx.ConnectError("foo")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise expected_error
+
+        with patch(
+            "src.httperactor.pool.httpx.AsyncHTTPTransport",
+            side_effect=lambda **kwargs: httpx.MockTransport(handler),
+        ):
+            async with HttpClientPool(
+                warmup_connections=1, error_handler=error_handler
+            ) as sut:
+                await sut.client("http://foo")
+
+        error_handler.handle.assert_awaited_once_with(expected_error)
+
+    async def test_when_probe_interval_not_shorter_than_keepalive_expiry__raises(
+        self,
+    ):
+        with pytest.raises(ValueError, match="5.0"):
+            HttpClientPool(keepalive_expiry=5.0, probe_interval=5.0)
+
+    async def test_sends_keep_alive_probes_when_idle(self, transport, received):
+        async with HttpClientPool(warmup_connections=1, probe_interval=0.01) as sut:
+            await sut.client("http://foo")
+            await asyncio.sleep(0.05)
+
+        assert len(received) > 1
+
+
+@pytest.mark.asyncio()
+class TestStats:
+    async def test_reports_requests_per_base_url(self, transport):
+        async with HttpClientPool(max_connections=4, warmup_connections=2) as sut:
+            await sut.start("http://foo", "http://bar")
+
+            stats = sut.stats()
+
+        assert stats == [
+            PoolStats(
+                base_url=base_url,
+                max_connections=4,
+                in_flight=0,
+                peak_in_flight=1,
+                requests=2,
+                saturated_requests=0,
+            )
+            for base_url in ("http://foo", "http://bar")
+        ]
+
+    async def test_counts_requests_started_with_pool_exhausted(self):
+        release = asyncio.Event()
+
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                await release.wait()
+                return httpx.Response(200)
+
+        with patch(
+            "src.httperactor.pool.httpx.AsyncHTTPTransport",
+            side_effect=lambda **kwargs: SlowTransport(),
+        ):
+            async with HttpClientPool(max_connections=1) as sut:
+                await sut.client("http://foo")
+                httpx_client = sut._clients["http://foo"].httpx_client  # noqa: SLF001
+                tasks = [asyncio.create_task(httpx_client.get("/")) for _ in range(2)]
+                await asyncio.sleep(0)
+
+                (busy,) = sut.stats()
+                release.set()
+                await asyncio.gather(*tasks)
+
+        assert busy.utilization == 2
+        assert busy.saturated_requests == 1
+
+    async def test_counts_streamed_request_in_flight_until_closed(self, transport):
+        async with HttpClientPool() as sut:
+            await sut.client("http://foo")
+            httpx_client = sut._clients["http://foo"].httpx_client  # noqa: SLF001
+
+            async with httpx_client.stream("GET", "/") as response:
+                (streaming,) = sut.stats()
+                await response.aread()
+            (closed,) = sut.stats()
+
+        assert streaming.in_flight == 1
+        assert closed.in_flight == 0
+
+    async def test_when_http2__does_not_count_saturated_requests(self):
+        release = asyncio.Event()
+
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                await release.wait()
+                return httpx.Response(200)
+
+        with patch(
+            "src.httperactor.pool.httpx.AsyncHTTPTransport",
+            side_effect=lambda **kwargs: SlowTransport(),
+        ):
+            async with HttpClientPool(max_connections=1, http2=True) as sut:
+                await sut.client("http://foo")
+                httpx_client = sut._clients["http://foo"].httpx_client  # noqa: SLF001
+                tasks = [asyncio.create_task(httpx_client.get("/")) for _ in range(2)]
+                await asyncio.sleep(0)
+                release.set()
+                await asyncio.gather(*tasks)
+
+                (stats,) = sut.stats()
+
+        assert stats.saturated_requests == 0
+
+
+@pytest.mark.asyncio()
+class TestAclose:
+    async def test_awaits_cancelled_probe_tasks(self, transport):
+        sut = HttpClientPool(probe_interval=0.01)
+        await sut.client("http://foo")
+        probe_task = sut._clients["http://foo"].probe_task  # noqa: SLF001
+
+        await sut.aclose()
+
+        assert probe_task.done()
@@ -0,0 +1,89 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.httperactor.rate_limiter import RateLimiter, RateLimiterStats
+
+
+@pytest.fixture()
+def clock():
+    with patch("src.httperactor.rate_limiter.time.monotonic", return_value=100.0) as p:
+        yield p
+
+
+@pytest.fixture()
+def sleep():
+    with patch("src.httperactor.rate_limiter.asyncio.sleep", new=AsyncMock()) as p:
+        yield p
+
+
+@pytest.mark.asyncio()
+class TestAcquire:
+    async def test_within_burst__does_not_wait(self, clock, sleep):
+        sut = RateLimiter(rate=10, burst=3)
+
+        waits = [await sut.acquire() for _ in range(3)]
+
+        assert waits == [0, 0, 0]
+        sleep.assert_not_awaited()
+
+    async def test_over_rate__delays_callers_by_interval(self, clock, sleep):
+        sut = RateLimiter(rate=10)
+
+        waits = [await sut.acquire() for _ in range(3)]
+
+        assert waits == pytest.approx([0, 0.1, 0.2])
+        assert sleep.await_count == 2
+
+    async def test_reports_wait_stats(self, clock, sleep):
+        sut = RateLimiter(rate=10)
+
+        for _ in range(3):
+            await sut.acquire()
+
+        assert sut.stats == pytest.approx(
+            RateLimiterStats(acquired=3, delayed=2, total_wait=0.3, max_wait=0.2)
+        )
+
+
+@pytest.mark.asyncio()
+class TestUpdate:
+    async def test_retry_after__blocks_until_it_passes(self, clock, sleep):
+        sut = RateLimiter(rate=100)
+
+        sut.update({"retry-after": "2"})
+
+        assert await sut.acquire() == pytest.approx(2)
+
+    async def test_exhausted_quota__blocks_until_reset(self, clock, sleep):
+        sut = RateLimiter(rate=100)
+
+        sut.update({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "3"})
+
+        assert await sut.acquire() == pytest.approx(3)
+
+    async def test_epoch_reset__is_converted_to_seconds(self, clock, sleep):
+        sut = RateLimiter(rate=100)
+
+        sut.update(
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(time.time() + 5)}
+        )
+
+        assert 4 < await sut.acquire() <= 5
+
+    async def test_remaining_quota__is_spread_until_reset(self, clock, sleep):
+        sut = RateLimiter(rate=100)
+
+        sut.update({"x-ratelimit-remaining": "4", "x-ratelimit-reset": "2"})
+        waits = [await sut.acquire() for _ in range(2)]
+
+        assert waits == pytest.approx([0, 0.5])
+
+    async def test_remaining_quota__never_exceeds_configured_rate(self, clock, sleep):
+        sut = RateLimiter(rate=1)
+
+        sut.update({"x-ratelimit-remaining": "100", "x-ratelimit-reset": "1"})
+        waits = [await sut.acquire() for _ in range(2)]
+
+        assert waits == pytest.approx([0, 1])
@@ -26,3 +26,19 @@ class TestDefaults:
 
     def test_method__returns_get(self, sut):
         assert sut.method == HttpMethod.GET
+
+    def test_idempotent__returns_true(self, sut):
+        assert sut.idempotent
+
+    def test_rate_limit_class__returns_request_class(self, sut):
+        assert sut.rate_limit_class is DefaultRequest
+
+
+class PostRequest(DefaultRequest):
+    @property
+    def method(self) -> HttpMethod:
+        return HttpMethod.POST
+
+
+def test_idempotent__when_method_is_post__returns_false():
+    assert not PostRequest().idempotent
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import PropertyMock, create_autospec, patch
+
+import httpx
+import pytest
+
+from src.httperactor.abc import Request
+from src.httperactor.retry import RetryBudget, RetryPolicy, retry_after
+
+
+@pytest.fixture()
+def create_request():
+    def factory(idempotent: bool = True) -> Request:
+        request = create_autospec(Request)
+        type(request).idempotent = PropertyMock(return_value=idempotent)
+        return request
+
+    return factory
+
+
+class TestRetryAfter:
+    def test_when_missing__returns_none(self):
+        assert retry_after({}) is None
+
+    def test_parses_seconds(self):
+        assert retry_after({"retry-after": "3"}) == 3.0
+
+    def test_parses_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = retry_after({"retry-after": format_datetime(retry_at, usegmt=True)})
+
+        assert 28 < delay <= 30
+
+    def test_when_malformed__returns_none(self):
+        assert retry_after({"retry-after": "soon"}) is None
+
+
+class TestRetryBudget:
+    def test_withdraws_up_to_capacity(self):
+        sut = RetryBudget(capacity=2, refill_rate=0)
+
+        assert [sut.withdraw() for _ in range(3)] == [True, True, False]
+
+    def test_refills_over_time(self):
+        with patch("src.httperactor.retry.time.monotonic", return_value=0.0):
+            sut = RetryBudget(capacity=1, refill_rate=2)
+            sut.withdraw()
+
+        with patch("src.httperactor.retry.time.monotonic", return_value=0.5):
+            assert sut.withdraw()
+
+
+class TestRetryPolicy:
+    def test_on_transport_error__returns_delay_within_backoff(self, create_request):
+        sut = RetryPolicy(base_delay=1.0, max_attempts=5, budget=RetryBudget(capacity=20))
+
+        delays = [sut.delay(create_request(), attempt=3) for _ in range(20)]
+
+        assert all(0 <= delay <= 4.0 for delay in delays)
+
+    def test_caps_backoff_at_max_delay(self, create_request):
+        sut = RetryPolicy(base_delay=1.0, max_delay=2.0, max_attempts=10)
+
+        assert sut.delay(create_request(), attempt=8) <= 2.0
+
+    def test_when_attempts_exhausted__returns_none(self, create_request):
+        sut = RetryPolicy(max_attempts=2)
+
+        assert sut.delay(create_request(), attempt=2) is None
+
+    def test_when_request_not_idempotent__returns_none(self, create_request):
+        sut = RetryPolicy()
+
+        assert sut.delay(create_request(idempotent=False), attempt=1) is None
+
+    def test_when_status_not_retryable__returns_none(self, create_request):
+        sut = RetryPolicy()
+
+        assert sut.delay(create_request(), 1, httpx.Response(400)) is None
+
+    def test_respects_retry_after(self, create_request):
+        sut = RetryPolicy()
+        response = httpx.Response(503, headers={"Retry-After": "2"})
+
+        assert sut.delay(create_request(), 1, response) == 2.0
+
+    def test_when_retry_after_exceeds_max_delay__returns_none(self, create_request):
+        sut = RetryPolicy(max_delay=1.0)
+        response = httpx.Response(429, headers={"Retry-After": "5"})
+
+        assert sut.delay(create_request(), 1, response) is None
+
+    def test_when_budget_exhausted__returns_none(self, create_request):
+        sut = RetryPolicy(budget=RetryBudget(capacity=1, refill_rate=0))
+
+        assert sut.delay(create_request(), 1) is not None
+        assert sut.delay(create_request(), 1) is None
@@ -0,0 +1,210 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.httperactor.traffic import (
+    CapturedExchange,
+    LoadReport,
+    RecordingTransport,
+    ReplayTransport,
+    generate_load,
+    main,
+    read_capture,
+)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+@pytest.fixture()
+def capture_path(tmp_path):
+    return tmp_path / "capture.jsonl"
+
+
+@pytest.fixture()
+def create_exchange():
+    def factory(
+        start: float = 0.0, url: str = "http://test/foo", status_code: int = 200
+    ) -> CapturedExchange:
+        return CapturedExchange(
+            start=start,
+            duration=0.001,
+            method="GET",
+            url=url,
+            request_headers=[("host", "test")],
+            request_body=b"",
+            status_code=status_code,
+            response_headers=[("content-type", "text/plain")],
+            response_body=url.encode(),
+        )
+
+    return factory
+
+
+class TestCapturedExchange:
+    def test_round_trips_through_line(self, create_exchange):
+        exchange = create_exchange(start=1.5)
+
+        assert CapturedExchange.from_line(exchange.to_line()) == exchange
+
+
+@pytest.mark.asyncio()
+class TestRecordingTransport:
+    async def test_returns_response_of_wrapped_transport(self, capture_path):
+        transport = RecordingTransport(
+            capture_path, transport=httpx.MockTransport(handler)
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("http://test/foo")
+
+        assert response.json() == {"path": "/foo"}
+
+    async def test_appends_exchanges_to_capture_file(self, capture_path):
+        transport = RecordingTransport(
+            capture_path, transport=httpx.MockTransport(handler)
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("http://test/foo")
+            await client.post("http://test/bar", json={"a": 1})
+
+        exchanges = read_capture(capture_path)
+        assert [(e.method, e.url) for e in exchanges] == [
+            ("GET", "http://test/foo"),
+            ("POST", "http://test/bar"),
+        ]
+        assert exchanges[1].request_body == b'{"a":1}'
+        assert exchanges[1].response_body == b'{"path":"/bar"}'
+        assert exchanges[0].start <= exchanges[1].start
+
+    async def test_leaves_sensitive_headers_out_of_capture(self, capture_path):
+        transport = RecordingTransport(
+            capture_path, transport=httpx.MockTransport(handler)
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(
+                "http://test/foo", headers={"Authorization": "secret", "X-Foo": "foo"}
+            )
+
+        (exchange,) = read_capture(capture_path)
+        names = [name for name, _ in exchange.request_headers]
+        assert "x-foo" in names
+        assert "authorization" not in names
+
+    async def test_captures_headers_not_in_redacted_headers(self, capture_path):
+        transport = RecordingTransport(
+            capture_path, transport=httpx.MockTransport(handler), redacted_headers=()
+        )
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("http://test/foo", headers={"Authorization": "secret"})
+
+        (exchange,) = read_capture(capture_path)
+        assert ("authorization", "secret") in exchange.request_headers
+
+    async def test_keeps_distance_between_sessions_appended_to_file(self, capture_path):
+        for now in (100.0, 160.0):
+            transport = RecordingTransport(
+                capture_path, transport=httpx.MockTransport(handler)
+            )
+            with patch("src.httperactor.traffic.time.time", return_value=now):
+                async with httpx.AsyncClient(transport=transport) as client:
+                    await client.get("http://test/foo")
+
+        assert [e.start for e in read_capture(capture_path)] == [0.0, 60.0]
+
+
+@pytest.mark.asyncio()
+class TestReplayTransport:
+    async def test_answers_with_captured_responses_in_order(self, create_exchange):
+        first = create_exchange()._replace(response_body=b"first")
+        second = create_exchange()._replace(response_body=b"second")
+        transport = ReplayTransport([first, second])
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            texts = [(await client.get("http://test/foo")).text for _ in range(3)]
+
+        assert texts == ["first", "second", "first"]
+
+    async def test_when_no_captured_response__answers_not_found(self, create_exchange):
+        transport = ReplayTransport([create_exchange()])
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("http://test/bar")
+
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio()
+class TestGenerateLoad:
+    async def test_reports_requests_and_errors(self, create_exchange):
+        exchanges = [
+            create_exchange(start=0.0, url="http://test/foo"),
+            create_exchange(start=0.01, url="http://test/bar", status_code=503),
+        ]
+
+        async with httpx.AsyncClient(transport=ReplayTransport(exchanges)) as client:
+            report = await generate_load(exchanges, client, speed=10)
+
+        assert report.requests == 2
+        assert report.errors == 1
+        assert report.p50 <= report.p90 <= report.p99
+        assert report.throughput > 0
+
+    async def test_paces_unsorted_exchanges_from_earliest_start(self, create_exchange):
+        exchanges = [create_exchange(start=10.0), create_exchange(start=0.0)]
+
+        async with httpx.AsyncClient(transport=ReplayTransport(exchanges)) as client:
+            report = await generate_load(exchanges, client, speed=100)
+
+        assert report.elapsed >= 0.09
+
+    async def test_rewrites_origin_to_base_url(self, create_exchange):
+        urls = []
+
+        def recording_handler(request: httpx.Request) -> httpx.Response:
+            urls.append(str(request.url))
+            return httpx.Response(200)
+
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(recording_handler)
+        ) as client:
+            await generate_load(
+                [create_exchange(url="http://test/foo?a=1")],
+                client,
+                base_url="http://localhost:8000",
+            )
+
+        assert urls == ["http://localhost:8000/foo?a=1"]
+
+    async def test_when_no_exchanges__reports_empty_load(self):
+        async with httpx.AsyncClient(transport=ReplayTransport([])) as client:
+            report = await generate_load([], client)
+
+        assert report == LoadReport(
+            requests=0, errors=0, elapsed=report.elapsed, p50=0.0, p90=0.0, p99=0.0
+        )
+
+
+class TestMain:
+    def test_prints_load_report(self, capture_path, create_exchange, capsys):
+        capture_path.write_text(create_exchange().to_line() + "\n")
+
+        main([str(capture_path), "--speed", "10"])
+
+        assert "requests:   1 (0 errors)" in capsys.readouterr().out
+
+    def test_stand_in_keeps_captured_latency_when_accelerated(
+        self, capture_path, create_exchange, capsys
+    ):
+        exchange = create_exchange()._replace(duration=0.05)
+        capture_path.write_text(exchange.to_line() + "\n")
+
+        main([str(capture_path), "--speed", "100"])
+
+        latency = capsys.readouterr().out.split("p50=")[1].split("ms")[0]
+        assert float(latency) >= 50
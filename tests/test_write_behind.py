@@ -0,0 +1,314 @@
+import asyncio
+from collections.abc import Callable
+from unittest.mock import AsyncMock, Mock, PropertyMock, create_autospec, patch
+
+import httpx
+import pytest
+
+from src.httperactor.abc import AuthMiddleware, HttpClientBase, Request
+from src.httperactor.client import HttpClient
+from src.httperactor.http_method import HttpMethod
+from src.httperactor.rate_limiter import RateLimiter
+from src.httperactor.retry import RetryPolicy
+from src.httperactor.write_behind import WriteBehindQueue
+
+
+@pytest.fixture()
+def http_client() -> HttpClientBase:
+    client = create_autospec(HttpClientBase)
+    client.send = AsyncMock(return_value="ok")
+    return client
+
+
+@pytest.fixture()
+def create_request() -> Callable[[HttpMethod, str, list | dict | None], Request]:
+    def factory(
+        method: HttpMethod = HttpMethod.PATCH,
+        path: str = "/foo",
+        body: list | dict | None = None,
+    ) -> Request:
+        request = create_autospec(Request)
+        type(request).method = PropertyMock(return_value=method)
+        type(request).path = PropertyMock(return_value=path)
+        type(request).body = PropertyMock(return_value=body)
+        type(request).headers = PropertyMock(return_value=[])
+        return request
+
+    return factory
+
+
+@pytest.fixture()
+def create_sut(http_client) -> Callable[..., WriteBehindQueue]:
+    def factory(**kwargs) -> WriteBehindQueue:
+        kwargs.setdefault("max_delay", 60)
+        return WriteBehindQueue(http_client=http_client, **kwargs)
+
+    return factory
+
+
+def sent_bodies(http_client: HttpClientBase) -> list:
+    return [c.args[0].body for c in http_client.send.await_args_list]
+
+
+@pytest.mark.asyncio()
+class TestSubmit:
+    async def test_when_method_not_patch_or_put__raises_value_error(
+        self, create_sut, create_request
+    ):
+        sut = create_sut()
+
+        with pytest.raises(ValueError, match="POST"):
+            sut.submit(create_request(method=HttpMethod.POST))
+
+    async def test_merges_patch_bodies_for_same_path(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(body={"a": 1, "b": 1}))
+        sut.submit(create_request(body={"b": 2}))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": 1, "b": 2}]
+
+    async def test_concatenates_list_patch_bodies_for_same_path(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(body=[{"op": "add"}]))
+        sut.submit(create_request(body=[{"op": "remove"}]))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [[{"op": "add"}, {"op": "remove"}]]
+
+    async def test_when_bodies_incompatible__sends_writes_in_order(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(body={"a": 1}))
+        sut.submit(create_request(body=[{"op": "add"}]))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": 1}, [{"op": "add"}]]
+
+    async def test_put_supersedes_pending_writes_for_same_path(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(body={"a": 1}))
+        sut.submit(create_request(method=HttpMethod.PUT, body={"a": 2}))
+        sut.submit(create_request(method=HttpMethod.PUT, body={"a": 3}))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": 3}]
+        assert http_client.send.await_args.args[0].method == HttpMethod.PUT
+
+    async def test_merges_patch_into_pending_put(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(method=HttpMethod.PUT, body={"a": 1, "b": 1}))
+        sut.submit(create_request(body={"b": 2}))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": 1, "b": 2}]
+        assert http_client.send.await_args.args[0].method == HttpMethod.PUT
+
+    async def test_merges_nested_patch_bodies_recursively(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(body={"a": {"x": 1}, "b": None}))
+        sut.submit(create_request(body={"a": {"y": 2}}))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": {"x": 1, "y": 2}, "b": None}]
+
+    async def test_when_patch_replaces_object_with_value__sends_writes_in_order(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(body={"a": None}))
+        sut.submit(create_request(body={"a": {"y": 2}}))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": None}, {"a": {"y": 2}}]
+
+    async def test_applies_nested_patch_and_null_removal_to_pending_put(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(
+            create_request(method=HttpMethod.PUT, body={"a": {"x": 1}, "b": 1, "c": 1})
+        )
+        sut.submit(create_request(body={"a": {"y": 2, "x": None}, "b": None}))
+        await sut.flush()
+
+        assert sent_bodies(http_client) == [{"a": {"y": 2}, "c": 1}]
+
+    async def test_does_not_merge_writes_for_different_paths(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut()
+
+        sut.submit(create_request(path="/foo", body={"a": 1}))
+        sut.submit(create_request(path="/bar", body={"b": 1}))
+        await sut.flush()
+
+        assert http_client.send.await_count == 2
+
+    async def test_sends_with_auth_middleware(
+        self, create_sut, create_request, http_client
+    ):
+        auth = create_autospec(AuthMiddleware)
+        sut = create_sut(auth=auth)
+
+        sut.submit(create_request(body={"a": 1}))
+        await sut.flush()
+
+        assert http_client.send.await_args.kwargs == {"auth": auth}
+
+    async def test_resolves_futures_of_all_coalesced_callers(
+        self, create_sut, create_request
+    ):
+        sut = create_sut()
+
+        first = sut.submit(create_request(body={"a": 1}))
+        second = sut.submit(create_request(body={"b": 1}))
+        await sut.flush()
+
+        assert await first
+        assert await second
+
+    async def test_when_client_returns_none__resolves_futures_with_false(
+        self, create_sut, create_request, http_client
+    ):
+        http_client.send = AsyncMock(return_value=None)
+        sut = create_sut()
+
+        future = sut.submit(create_request(body={"a": 1}))
+        await sut.flush()
+
+        assert not await future
+
+    async def test_when_client_raises__sets_exception_on_futures(
+        self, create_sut, create_request, http_client
+    ):
+        http_client.send = AsyncMock(side_effect=ValueError("foo"))
+        sut = create_sut()
+
+        future = sut.submit(create_request(body={"a": 1}))
+        await sut.flush()
+
+        with pytest.raises(ValueError, match="foo"):
+            await future
+
+
+@pytest.mark.asyncio()
+class TestFlushTriggers:
+    async def test_flushes_after_max_delay(self, create_sut, create_request, http_client):
+        sut = create_sut(max_delay=0.01)
+
+        future = sut.submit(create_request(body={"a": 1}))
+
+        assert await asyncio.wait_for(future, timeout=1)
+        http_client.send.assert_awaited_once()
+
+    async def test_flushes_when_max_pending_reached(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut(max_pending=2)
+
+        sut.submit(create_request(path="/foo", body={"a": 1}))
+        future = sut.submit(create_request(path="/bar", body={"a": 1}))
+
+        assert await asyncio.wait_for(future, timeout=1)
+        assert sut.pending_count == 0
+
+    async def test_size_flush_cancels_pending_timer(
+        self, create_sut, create_request, http_client
+    ):
+        sut = create_sut(max_delay=0.2, max_pending=2)
+
+        sut.submit(create_request(path="/a", body={"a": 1}))
+        await sut.submit(create_request(path="/b", body={"b": 1}))
+        await asyncio.sleep(0.1)
+        sut.submit(create_request(path="/c", body={"x": 1}))
+        await asyncio.sleep(0.15)
+        sut.submit(create_request(path="/c", body={"y": 1}))
+        await sut.close()
+
+        assert sent_bodies(http_client)[2:] == [{"x": 1, "y": 1}]
+
+    async def test_bounds_concurrent_sends(self, create_sut, create_request, http_client):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return "ok"
+
+        http_client.send = Mock(side_effect=send)
+        sut = create_sut(max_concurrency=2)
+
+        for index in range(5):
+            sut.submit(create_request(path=f"/{index}", body={"a": index}))
+        await sut.close()
+
+        assert http_client.send.call_count == 5
+        assert max_in_flight == 2
+
+
+class RetryableUpdateRequest(Request[str]):
+    @property
+    def path(self) -> str:
+        return "/foo"
+
+    @property
+    def body(self) -> dict:
+        return {"a": 1}
+
+    @property
+    def method(self) -> HttpMethod:
+        return HttpMethod.PATCH
+
+    @property
+    def idempotent(self) -> bool:
+        return True
+
+    def map_response(self, response: str) -> str:
+        return response
+
+
+@pytest.mark.asyncio()
+class TestWithHttpClient:
+    async def test_applies_retry_opt_in_and_class_rate_limiter(self):
+        responses = [httpx.Response(503), httpx.Response(200)]
+        limiter = create_autospec(RateLimiter)
+        http_client = HttpClient(
+            httpx.AsyncClient(
+                base_url="http://test",
+                transport=httpx.MockTransport(lambda request: responses.pop(0)),
+            ),
+            retry_policy=RetryPolicy(),
+            rate_limiters={RetryableUpdateRequest: limiter},
+        )
+        sut = WriteBehindQueue(http_client=http_client, max_delay=60)
+
+        future = sut.submit(RetryableUpdateRequest())
+        with patch("src.httperactor.client.asyncio.sleep", new=AsyncMock()):
+            await sut.close()
+
+        assert await future
+        assert limiter.acquire.await_count == 2